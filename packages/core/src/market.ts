@@ -8,11 +8,24 @@ import { proxyFetch } from './proxy-fetch'
 
 const BINANCE_API = 'https://api.binance.com/api/v3'
 
+// 价格短时缓存：LLM 多轮工具调用常在几秒内重复查询同一交易对
+const PRICE_CACHE_TTL_MS = 10 * 1000
+const PRICE_CACHE_MAX_ENTRIES = 200
+const priceCache = new Map<string, { price: MarketPrice; expiresAt: number }>()
+
 /**
  * 获取单个交易对价格
  */
 export async function getPrice(symbol: string): Promise<MarketPrice> {
-  const response = await proxyFetch(`${BINANCE_API}/ticker/24hr?symbol=${symbol.toUpperCase()}`)
+  const upperSymbol = symbol.toUpperCase()
+
+  // 命中缓存且未过期时直接返回，避免重复请求 Binance
+  const cached = priceCache.get(upperSymbol)
+  if (cached && cached.expiresAt > Date.now()) {
+    return cached.price
+  }
+
+  const response = await proxyFetch(`${BINANCE_API}/ticker/24hr?symbol=${upperSymbol}`)
 
   if (!response.ok) {
     throw new Error(`Failed to fetch price for ${symbol}: ${response.statusText}`)
@@ -20,19 +33,32 @@ export async function getPrice(symbol: string): Promise<MarketPrice> {
 
   const data = await response.json()
 
-  return {
+  const price: MarketPrice = {
     symbol: data.symbol,
     price: parseFloat(data.lastPrice),
     change24h: parseFloat(data.priceChangePercent),
     timestamp: Date.now(),
   }
+
+  // 重新插入保证 Map 迭代顺序反映最近写入，超出上限时淘汰最旧条目
+  priceCache.delete(upperSymbol)
+  priceCache.set(upperSymbol, { price, expiresAt: Date.now() + PRICE_CACHE_TTL_MS })
+  if (priceCache.size > PRICE_CACHE_MAX_ENTRIES) {
+    const oldestKey = priceCache.keys().next().value
+    if (oldestKey !== undefined) {
+      priceCache.delete(oldestKey)
+    }
+  }
+  return price
 }
 
 /**
  * 获取多个交易对价格
  */
 export async function getPrices(symbols: string[]): Promise<MarketPrice[]> {
-  const promises = symbols.map((s) => getPrice(s))
+  // 先去重再并发请求：重复符号只查一次（Set 保留首次出现顺序）
+  const uniqueSymbols = [...new Set(symbols.map((s) => s.toUpperCase()))]
+  const promises = uniqueSymbols.map((s) => getPrice(s))
   return Promise.all(promises)
 }
 
@@ -23,6 +23,9 @@ export interface NewsRecord {
 // 数据库单例
 let db: Database | null = null
 
+// 缓存的批量插入语句（每次抓取复用，随数据库一起关闭）
+let insertStmt: ReturnType<Database['prepare']> | null = null
+
 /**
  * 获取数据库路径
  */
@@ -105,10 +108,13 @@ export function insertNews(items: NewsRecord[]): number {
   const database = getNewsDB()
   let inserted = 0
 
-  const stmt = database.prepare(`
-    INSERT OR IGNORE INTO news (id, title, summary, source, url, published_at, fetched_at, category)
-    VALUES ($id, $title, $summary, $source, $url, $publishedAt, $fetchedAt, $category)
-  `)
+  if (!insertStmt) {
+    insertStmt = database.prepare(`
+      INSERT OR IGNORE INTO news (id, title, summary, source, url, published_at, fetched_at, category)
+      VALUES ($id, $title, $summary, $source, $url, $publishedAt, $fetchedAt, $category)
+    `)
+  }
+  const stmt = insertStmt
 
   const insertMany = database.transaction((newsItems: NewsRecord[]) => {
     for (const item of newsItems) {
@@ -283,6 +289,7 @@ export function formatToBeijingTime(timestamp: number): string {
  */
 export function closeNewsDB(): void {
   if (db) {
+    insertStmt = null
     db.close()
     db = null
   }
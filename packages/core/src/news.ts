@@ -23,6 +23,25 @@ export interface NewsItem {
   category?: string
 }
 
+/**
+ * 中英文关键词映射（用于扩展搜索）
+ * 模块级常量，避免每次搜索重新构建
+ */
+const KEYWORD_MAP: Record<string, string[]> = {
+  '比特币': ['bitcoin', 'btc'],
+  '以太坊': ['ethereum', 'eth'],
+  '加密货币': ['crypto', 'cryptocurrency'],
+  '区块链': ['blockchain'],
+  '币安': ['binance'],
+  '交易所': ['exchange'],
+  '苹果': ['apple', 'aapl'],
+  '特斯拉': ['tesla', 'tsla'],
+  '微软': ['microsoft', 'msft'],
+  '谷歌': ['google', 'googl'],
+  '亚马逊': ['amazon', 'amzn'],
+  '英伟达': ['nvidia', 'nvda'],
+}
+
 /**
  * 将内部记录转换为对外接口
  */
@@ -40,11 +59,12 @@ function toNewsItem(record: NewsRecord): NewsItem {
 
 /**
  * 获取最新新闻
+ * 纯同步的 SQLite 读取，无需 async 包装
  */
-export async function getNews(options?: {
+export function getNews(options?: {
   limit?: number
   category?: string
-}): Promise<NewsItem[]> {
+}): NewsItem[] {
   const { limit = 20, category } = options || {}
 
   const records = getLatestNews(limit, category)
@@ -54,32 +74,13 @@ export async function getNews(options?: {
 /**
  * 搜索新闻
  */
-export async function searchNews(
-  query: string,
-  options?: { limit?: number }
-): Promise<NewsItem[]> {
+export function searchNews(query: string, options?: { limit?: number }): NewsItem[] {
   const { limit = 20 } = options || {}
 
   if (!query || !query.trim()) {
     return getNews({ limit })
   }
 
-  // 中英文关键词映射（用于扩展搜索）
-  const keywordMap: Record<string, string[]> = {
-    '比特币': ['bitcoin', 'btc'],
-    '以太坊': ['ethereum', 'eth'],
-    '加密货币': ['crypto', 'cryptocurrency'],
-    '区块链': ['blockchain'],
-    '币安': ['binance'],
-    '交易所': ['exchange'],
-    '苹果': ['apple', 'aapl'],
-    '特斯拉': ['tesla', 'tsla'],
-    '微软': ['microsoft', 'msft'],
-    '谷歌': ['google', 'googl'],
-    '亚马逊': ['amazon', 'amzn'],
-    '英伟达': ['nvidia', 'nvda'],
-  }
-
   // 构建 FTS5 查询
   const keywords = query.toLowerCase().split(/\s+/).filter(k => k.length > 0)
   const expandedKeywords = new Set<string>()
@@ -87,8 +88,8 @@ export async function searchNews(
   for (const keyword of keywords) {
     expandedKeywords.add(keyword)
     // 如果是中文关键词，添加对应的英文
-    if (keywordMap[keyword]) {
-      keywordMap[keyword].forEach(k => expandedKeywords.add(k))
+    if (KEYWORD_MAP[keyword]) {
+      KEYWORD_MAP[keyword].forEach(k => expandedKeywords.add(k))
     }
   }
 
@@ -28,6 +28,38 @@ export async function proxyFetch(
   return fetch(url.toString(), init as globalThis.RequestInit)
 }
 
+/**
+ * 带重试的 fetch：网络错误或 5xx 响应时指数退避后重试
+ * 仅用于幂等的 GET 请求（如 RSS 抓取）
+ */
+export async function proxyFetchWithRetry(
+  url: string | URL | RequestInfo,
+  init?: RequestInit,
+  retries: number = 2,
+  backoffMs: number = 1000
+): Promise<Response> {
+  let lastError: unknown
+
+  for (let attempt = 0; attempt <= retries; attempt++) {
+    if (attempt > 0) {
+      await new Promise((resolve) => setTimeout(resolve, backoffMs * 2 ** (attempt - 1)))
+    }
+
+    try {
+      const response = await proxyFetch(url, init)
+      // 5xx 视为临时故障，留给下一轮重试
+      if (response.status >= 500 && attempt < retries) {
+        continue
+      }
+      return response
+    } catch (error) {
+      lastError = error
+    }
+  }
+
+  throw lastError
+}
+
 /**
  * 获取代理 URL（供其他库使用）
  */
@@ -4,7 +4,8 @@
  */
 
 import { insertNews, cleanupOldNews, type NewsRecord } from './news-store'
-import { proxyFetch } from './proxy-fetch'
+import { proxyFetchWithRetry } from './proxy-fetch'
+import { createIntervalScheduler } from './scheduler'
 
 /**
  * RSS 源配置
@@ -29,8 +30,13 @@ const DEFAULT_RSS_SOURCES: RSSSource[] = [
   { name: 'CoinDesk', url: 'https://www.coindesk.com/arc/outboundfeeds/rss/', category: 'crypto' },
 ]
 
-// 定时器引用
-let schedulerInterval: ReturnType<typeof setInterval> | null = null
+// 定时抓取调度器
+const scheduler = createIntervalScheduler({
+  name: 'RSSFetcher',
+  task: () => fetchAllRSS(),
+  intervalEnvVar: 'RSS_FETCH_INTERVAL',
+  defaultIntervalMinutes: 15,
+})
 
 /**
  * 解析 RSS 时间格式为 UTC timestamp
@@ -60,114 +66,168 @@ function generateNewsId(url: string): string {
   return hash.toString(16).slice(0, 16)
 }
 
+// HTML 实体映射与匹配正则（模块级，cleanText 是每条新闻都要走的热路径）
+const HTML_ENTITY_MAP: Record<string, string> = {
+  '&nbsp;': ' ',
+  '&amp;': '&',
+  '&lt;': '<',
+  '&gt;': '>',
+  '&quot;': '"',
+  '&#39;': "'",
+}
+const HTML_ENTITY_RE = /&(?:nbsp|amp|lt|gt|quot|#39);/g
+const HTML_TAG_RE = /<[^>]*>/g
+const WHITESPACE_RE = /\s+/g
+
+// RSS 2.0 / Atom 条目解析正则（模块级，逐条解析时不再重复创建）
+const RSS_ITEM_RE = /<item>([\s\S]*?)<\/item>/gi
+const RSS_TITLE_CDATA_RE = /<title><!\[CDATA\[([\s\S]*?)\]\]><\/title>/i
+const RSS_TITLE_RE = /<title>([\s\S]*?)<\/title>/i
+const RSS_LINK_RE = /<link>([\s\S]*?)<\/link>/i
+const RSS_DESC_CDATA_RE = /<description><!\[CDATA\[([\s\S]*?)\]\]><\/description>/i
+const RSS_DESC_RE = /<description>([\s\S]*?)<\/description>/i
+const RSS_PUBDATE_RE = /<pubDate>([\s\S]*?)<\/pubDate>/i
+const ATOM_ENTRY_RE = /<entry>([\s\S]*?)<\/entry>/gi
+const ATOM_TITLE_RE = /<title[^>]*>([\s\S]*?)<\/title>/i
+const ATOM_LINK_RE = /<link[^>]*href=["']([^"']+)["'][^>]*\/?>/i
+const ATOM_SUMMARY_RE = /<summary[^>]*>([\s\S]*?)<\/summary>/i
+const ATOM_CONTENT_RE = /<content[^>]*>([\s\S]*?)<\/content>/i
+const ATOM_UPDATED_RE = /<updated>([\s\S]*?)<\/updated>/i
+const ATOM_PUBLISHED_RE = /<published>([\s\S]*?)<\/published>/i
+
 /**
  * 清理 HTML 标签和多余空白
  */
 function cleanText(text: string): string {
   return text
-    .replace(/<[^>]*>/g, '') // 移除 HTML 标签
-    .replace(/&nbsp;/g, ' ')
-    .replace(/&amp;/g, '&')
-    .replace(/&lt;/g, '<')
-    .replace(/&gt;/g, '>')
-    .replace(/&quot;/g, '"')
-    .replace(/&#39;/g, "'")
-    .replace(/\s+/g, ' ') // 合并多余空白
+    .replace(HTML_TAG_RE, '') // 移除 HTML 标签
+    .replace(HTML_ENTITY_RE, (entity) => HTML_ENTITY_MAP[entity]) // 单趟解码常见实体
+    .replace(WHITESPACE_RE, ' ') // 合并多余空白
     .trim()
 }
 
+// 条件请求验证器缓存：记录各源最近一次响应的 ETag / Last-Modified
+const feedValidators = new Map<string, { etag?: string; lastModified?: string }>()
+
+/**
+ * 截断文本，避免把 UTF-16 代理对（emoji 等）从中间切开产生乱码
+ */
+function truncateText(text: string, maxLength: number): string {
+  if (text.length <= maxLength) return text
+
+  let end = maxLength
+  const code = text.charCodeAt(end - 1)
+  // 截断点落在高位代理上时回退一位，保证不产生孤立代理项
+  if (code >= 0xd800 && code <= 0xdbff) {
+    end--
+  }
+
+  return text.slice(0, end)
+}
+
 /**
  * 解析单个 RSS Feed
  */
 async function parseRSSFeed(source: RSSSource): Promise<NewsRecord[]> {
   try {
-    const response = await proxyFetch(source.url, {
-      headers: {
-        'User-Agent': 'MarketPulse/2.0 RSS Reader',
-        Accept: 'application/rss+xml, application/xml, text/xml',
-      },
-    })
+    const headers: Record<string, string> = {
+      'User-Agent': 'MarketPulse/2.0 RSS Reader',
+      Accept: 'application/rss+xml, application/xml, text/xml',
+    }
+
+    // 带上上次的验证器做条件请求，源未更新时服务器直接返回 304
+    const validators = feedValidators.get(source.url)
+    if (validators?.etag) headers['If-None-Match'] = validators.etag
+    if (validators?.lastModified) headers['If-Modified-Since'] = validators.lastModified
+
+    const response = await proxyFetchWithRetry(source.url, { headers })
+
+    if (response.status === 304) {
+      console.log(`[RSSFetcher] ${source.name} not modified (304), skipping parse`)
+      return []
+    }
 
     if (!response.ok) {
       console.error(`[RSSFetcher] Failed to fetch ${source.name}: ${response.status}`)
       return []
     }
 
+    // 记录本次响应的验证器，供下一轮条件请求使用
+    const etag = response.headers.get('etag')
+    const lastModified = response.headers.get('last-modified')
+    if (etag || lastModified) {
+      feedValidators.set(source.url, {
+        etag: etag || undefined,
+        lastModified: lastModified || undefined,
+      })
+    }
+
     const xml = await response.text()
     const items: NewsRecord[] = []
     const now = Date.now()
 
     // 解析 RSS 2.0 格式的 <item>
-    const itemMatches = xml.match(/<item>([\s\S]*?)<\/item>/gi) || []
+    const itemMatches = xml.match(RSS_ITEM_RE) || []
 
     for (const itemXml of itemMatches) {
-      // 提取标题
-      const titleMatch =
-        itemXml.match(/<title><!\[CDATA\[([\s\S]*?)\]\]><\/title>/i) ||
-        itemXml.match(/<title>([\s\S]*?)<\/title>/i)
+      // 先提取标题和链接，缺失则直接跳过，省掉摘要/时间的解析开销
+      const titleMatch = itemXml.match(RSS_TITLE_CDATA_RE) || itemXml.match(RSS_TITLE_RE)
       const title = titleMatch ? cleanText(titleMatch[1]) : ''
 
-      // 提取链接
-      const linkMatch = itemXml.match(/<link>([\s\S]*?)<\/link>/i)
+      const linkMatch = itemXml.match(RSS_LINK_RE)
       const url = linkMatch ? linkMatch[1].trim() : ''
 
+      if (!title || !url) continue
+
       // 提取描述/摘要
-      const descMatch =
-        itemXml.match(/<description><!\[CDATA\[([\s\S]*?)\]\]><\/description>/i) ||
-        itemXml.match(/<description>([\s\S]*?)<\/description>/i)
-      const summary = descMatch ? cleanText(descMatch[1]).slice(0, 500) : ''
+      const descMatch = itemXml.match(RSS_DESC_CDATA_RE) || itemXml.match(RSS_DESC_RE)
+      const summary = descMatch ? truncateText(cleanText(descMatch[1]), 500) : ''
 
       // 提取发布时间
-      const pubDateMatch = itemXml.match(/<pubDate>([\s\S]*?)<\/pubDate>/i)
+      const pubDateMatch = itemXml.match(RSS_PUBDATE_RE)
       const publishedAt = parseRSSDate(pubDateMatch?.[1])
 
-      if (title && url) {
-        items.push({
-          id: generateNewsId(url),
-          title,
-          summary: summary || null,
-          source: source.name,
-          url,
-          publishedAt,
-          fetchedAt: now,
-          category: source.category,
-        })
-      }
+      items.push({
+        id: generateNewsId(url),
+        title,
+        summary: summary || null,
+        source: source.name,
+        url,
+        publishedAt,
+        fetchedAt: now,
+        category: source.category,
+      })
     }
 
     // 如果没有找到 RSS 2.0 格式，尝试 Atom 格式
     if (items.length === 0) {
-      const entryMatches = xml.match(/<entry>([\s\S]*?)<\/entry>/gi) || []
+      const entryMatches = xml.match(ATOM_ENTRY_RE) || []
 
       for (const entryXml of entryMatches) {
-        const titleMatch = entryXml.match(/<title[^>]*>([\s\S]*?)<\/title>/i)
+        const titleMatch = entryXml.match(ATOM_TITLE_RE)
         const title = titleMatch ? cleanText(titleMatch[1]) : ''
 
-        const linkMatch = entryXml.match(/<link[^>]*href=["']([^"']+)["'][^>]*\/?>/i)
+        const linkMatch = entryXml.match(ATOM_LINK_RE)
         const url = linkMatch ? linkMatch[1].trim() : ''
 
-        const summaryMatch =
-          entryXml.match(/<summary[^>]*>([\s\S]*?)<\/summary>/i) ||
-          entryXml.match(/<content[^>]*>([\s\S]*?)<\/content>/i)
-        const summary = summaryMatch ? cleanText(summaryMatch[1]).slice(0, 500) : ''
+        if (!title || !url) continue
+
+        const summaryMatch = entryXml.match(ATOM_SUMMARY_RE) || entryXml.match(ATOM_CONTENT_RE)
+        const summary = summaryMatch ? truncateText(cleanText(summaryMatch[1]), 500) : ''
 
-        const updatedMatch =
-          entryXml.match(/<updated>([\s\S]*?)<\/updated>/i) ||
-          entryXml.match(/<published>([\s\S]*?)<\/published>/i)
+        const updatedMatch = entryXml.match(ATOM_UPDATED_RE) || entryXml.match(ATOM_PUBLISHED_RE)
         const publishedAt = parseRSSDate(updatedMatch?.[1])
 
-        if (title && url) {
-          items.push({
-            id: generateNewsId(url),
-            title,
-            summary: summary || null,
-            source: source.name,
-            url,
-            publishedAt,
-            fetchedAt: now,
-            category: source.category,
-          })
-        }
+        items.push({
+          id: generateNewsId(url),
+          title,
+          summary: summary || null,
+          source: source.name,
+          url,
+          publishedAt,
+          fetchedAt: now,
+          category: source.category,
+        })
       }
     }
 
@@ -179,20 +239,44 @@ async function parseRSSFeed(source: RSSSource): Promise<NewsRecord[]> {
   }
 }
 
+// 进行中的抓取 Promise：定时任务与手动刷新重叠时共享同一次抓取
+let inflightFetch: Promise<{ total: number; inserted: number }> | null = null
+
 /**
  * 抓取所有 RSS 源
  */
 export async function fetchAllRSS(
   sources: RSSSource[] = DEFAULT_RSS_SOURCES
 ): Promise<{ total: number; inserted: number }> {
+  // 默认源场景下，如果已有抓取在进行，直接等待它的结果
+  if (sources !== DEFAULT_RSS_SOURCES) {
+    return doFetchAllRSS(sources)
+  }
+
+  if (!inflightFetch) {
+    inflightFetch = doFetchAllRSS(sources).finally(() => {
+      inflightFetch = null
+    })
+  }
+  return inflightFetch
+}
+
+async function doFetchAllRSS(sources: RSSSource[]): Promise<{ total: number; inserted: number }> {
   console.log(`[RSSFetcher] Starting fetch for ${sources.length} sources...`)
 
   const results = await Promise.allSettled(sources.map((source) => parseRSSFeed(source)))
 
+  // 不同源可能推送同一 URL，先用 seen-set 去重再写库
+  const seenIds = new Set<string>()
   const allItems: NewsRecord[] = []
   for (const result of results) {
     if (result.status === 'fulfilled') {
-      allItems.push(...result.value)
+      for (const item of result.value) {
+        if (!seenIds.has(item.id)) {
+          seenIds.add(item.id)
+          allItems.push(item)
+        }
+      }
     }
   }
 
@@ -213,34 +297,14 @@ export async function fetchAllRSS(
  * 启动定时抓取
  */
 export function startRSSScheduler(intervalMinutes?: number): void {
-  if (schedulerInterval) {
-    console.log('[RSSFetcher] Scheduler already running')
-    return
-  }
-
-  const interval = intervalMinutes || parseInt(process.env.RSS_FETCH_INTERVAL || '15', 10)
-  const intervalMs = interval * 60 * 1000
-
-  console.log(`[RSSFetcher] Starting scheduler with ${interval} minute interval`)
-
-  schedulerInterval = setInterval(async () => {
-    try {
-      await fetchAllRSS()
-    } catch (error) {
-      console.error('[RSSFetcher] Scheduled fetch error:', error)
-    }
-  }, intervalMs)
+  scheduler.start(intervalMinutes)
 }
 
 /**
  * 停止定时抓取
  */
 export function stopRSSScheduler(): void {
-  if (schedulerInterval) {
-    clearInterval(schedulerInterval)
-    schedulerInterval = null
-    console.log('[RSSFetcher] Scheduler stopped')
-  }
+  scheduler.stop()
 }
 
 /**
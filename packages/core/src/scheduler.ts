@@ -0,0 +1,60 @@
+/**
+ * Interval Scheduler Helper
+ * rss-fetcher / stock-fetcher 共用的定时任务封装
+ */
+
+export interface IntervalScheduler {
+  start(intervalMinutes?: number): void
+  stop(): void
+  isRunning(): boolean
+}
+
+/**
+ * 创建定时调度器
+ * 间隔优先级：显式参数 > 环境变量 > 默认值
+ */
+export function createIntervalScheduler(options: {
+  name: string
+  task: () => Promise<unknown>
+  intervalEnvVar: string
+  defaultIntervalMinutes: number
+}): IntervalScheduler {
+  const { name, task, intervalEnvVar, defaultIntervalMinutes } = options
+
+  let timer: ReturnType<typeof setInterval> | null = null
+
+  return {
+    start(intervalMinutes?: number): void {
+      if (timer) {
+        console.log(`[${name}] Scheduler already running`)
+        return
+      }
+
+      const interval =
+        intervalMinutes || parseInt(process.env[intervalEnvVar] || String(defaultIntervalMinutes), 10)
+      const intervalMs = interval * 60 * 1000
+
+      console.log(`[${name}] Starting scheduler with ${interval} minute interval`)
+
+      timer = setInterval(async () => {
+        try {
+          await task()
+        } catch (error) {
+          console.error(`[${name}] Scheduled fetch error:`, error)
+        }
+      }, intervalMs)
+    },
+
+    stop(): void {
+      if (timer) {
+        clearInterval(timer)
+        timer = null
+        console.log(`[${name}] Scheduler stopped`)
+      }
+    },
+
+    isRunning(): boolean {
+      return timer !== null
+    },
+  }
+}
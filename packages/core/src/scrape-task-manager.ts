@@ -136,3 +136,21 @@ export async function executeScrapeTask(taskId: string): Promise<void> {
 export function getScrapeTask(taskId: string): ScrapeTask | undefined {
   return tasks.get(taskId)
 }
+
+/**
+ * 查找同一 session 下关键词相同且仍在进行中的任务
+ * 用于合并重复触发，避免对同一批关键词并发抓取
+ */
+export function findActiveScrapeTask(sessionId: string, queries: string[]): ScrapeTask | undefined {
+  const key = [...queries].sort().join(',')
+
+  for (const task of tasks.values()) {
+    if (task.sessionId !== sessionId) continue
+    if (task.status !== 'pending' && task.status !== 'running') continue
+    if ([...task.queries].sort().join(',') === key) {
+      return task
+    }
+  }
+
+  return undefined
+}
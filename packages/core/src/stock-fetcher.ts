@@ -5,6 +5,7 @@
 
 import YahooFinance from 'yahoo-finance2'
 import { insertStockPrices, cleanupOldStocks, type StockRecord } from './stock-store'
+import { createIntervalScheduler } from './scheduler'
 
 // Initialize Yahoo Finance client
 // Note: yahoo-finance2 uses native fetch, proxy is handled via HTTP_PROXY env var
@@ -40,29 +41,42 @@ export const DEFAULT_COMMODITY_SYMBOLS = [
   'SLV',    // iShares Silver Trust (白银 ETF)
 ]
 
-// 定时器引用
-let schedulerInterval: ReturnType<typeof setInterval> | null = null
+// 定时抓取调度器
+const scheduler = createIntervalScheduler({
+  name: 'StockFetcher',
+  task: () => fetchAllStocks(),
+  intervalEnvVar: 'STOCK_FETCH_INTERVAL',
+  defaultIntervalMinutes: 5,
+})
+
+// 符号列表解析缓存：环境变量在进程内不变，只需解析一次
+let cachedStockSymbols: string[] | null = null
+let cachedCommoditySymbols: string[] | null = null
 
 /**
  * 获取配置的股票列表
  */
 export function getStockSymbols(): string[] {
-  const envSymbols = process.env.STOCK_SYMBOLS
-  if (envSymbols) {
-    return envSymbols.split(',').map((s) => s.trim().toUpperCase())
+  if (!cachedStockSymbols) {
+    const envSymbols = process.env.STOCK_SYMBOLS
+    cachedStockSymbols = envSymbols
+      ? envSymbols.split(',').map((s) => s.trim().toUpperCase())
+      : DEFAULT_STOCK_SYMBOLS
   }
-  return DEFAULT_STOCK_SYMBOLS
+  return cachedStockSymbols
 }
 
 /**
  * 获取贵金属/大宗商品列表
  */
 export function getCommoditySymbols(): string[] {
-  const envSymbols = process.env.COMMODITY_SYMBOLS
-  if (envSymbols) {
-    return envSymbols.split(',').map((s) => s.trim().toUpperCase())
+  if (!cachedCommoditySymbols) {
+    const envSymbols = process.env.COMMODITY_SYMBOLS
+    cachedCommoditySymbols = envSymbols
+      ? envSymbols.split(',').map((s) => s.trim().toUpperCase())
+      : DEFAULT_COMMODITY_SYMBOLS
   }
-  return DEFAULT_COMMODITY_SYMBOLS
+  return cachedCommoditySymbols
 }
 
 /**
@@ -75,7 +89,7 @@ export function getAllSymbols(): string[] {
 /**
  * 从 Yahoo Finance 抓取股票数据
  */
-async function fetchSingleStock(symbol: string): Promise<StockRecord | null> {
+async function fetchSingleStock(symbol: string, fetchedAt: number): Promise<StockRecord | null> {
   try {
     const quote = await yahooFinance.quote(symbol)
 
@@ -95,7 +109,7 @@ async function fetchSingleStock(symbol: string): Promise<StockRecord | null> {
       dayLow: quote.regularMarketDayLow ?? null,
       volume: quote.regularMarketVolume ?? null,
       marketCap: quote.marketCap ?? null,
-      fetchedAt: Date.now(),
+      fetchedAt,
     }
   } catch (error) {
     console.error(`[StockFetcher] Error fetching ${symbol}:`, error)
@@ -111,7 +125,9 @@ export async function fetchAllStocks(
 ): Promise<{ total: number; inserted: number; failed: string[] }> {
   console.log(`[StockFetcher] Starting fetch for ${symbols.length} symbols...`)
 
-  const results = await Promise.allSettled(symbols.map((symbol) => fetchSingleStock(symbol)))
+  // 同一批次共用一个抓取时间戳，也让同批记录的 fetched_at 保持一致
+  const fetchedAt = Date.now()
+  const results = await Promise.allSettled(symbols.map((symbol) => fetchSingleStock(symbol, fetchedAt)))
 
   const stockRecords: StockRecord[] = []
   const failed: string[] = []
@@ -148,39 +164,19 @@ export async function fetchAllStocks(
  * 启动定时抓取
  */
 export function startStockScheduler(intervalMinutes?: number): void {
-  if (schedulerInterval) {
-    console.log('[StockFetcher] Scheduler already running')
-    return
-  }
-
-  const interval = intervalMinutes || parseInt(process.env.STOCK_FETCH_INTERVAL || '5', 10)
-  const intervalMs = interval * 60 * 1000
-
-  console.log(`[StockFetcher] Starting scheduler with ${interval} minute interval`)
-
-  schedulerInterval = setInterval(async () => {
-    try {
-      await fetchAllStocks()
-    } catch (error) {
-      console.error('[StockFetcher] Scheduled fetch error:', error)
-    }
-  }, intervalMs)
+  scheduler.start(intervalMinutes)
 }
 
 /**
  * 停止定时抓取
  */
 export function stopStockScheduler(): void {
-  if (schedulerInterval) {
-    clearInterval(schedulerInterval)
-    schedulerInterval = null
-    console.log('[StockFetcher] Scheduler stopped')
-  }
+  scheduler.stop()
 }
 
 /**
  * 检查调度器是否运行
  */
 export function isStockSchedulerRunning(): boolean {
-  return schedulerInterval !== null
+  return scheduler.isRunning()
 }
@@ -9,7 +9,7 @@ import { searchNews, getNews } from './news'
 import { getStockPrices, getAllStockPrices } from './stock'
 import { getCommoditySymbols, DEFAULT_COMMODITY_SYMBOLS } from './stock-fetcher'
 import { searchTweetsInDB, getTopTweetsFromDB, getTwitterStats } from './twitter-store'
-import { registerScrapeTask, executeScrapeTask } from './scrape-task-manager'
+import { registerScrapeTask, executeScrapeTask, findActiveScrapeTask } from './scrape-task-manager'
 
 /**
  * Get crypto price tool (Binance)
@@ -111,9 +111,9 @@ export const searchNewsTool = tool({
     try {
       let results
       if (query && query.trim()) {
-        results = await searchNews(query, { limit })
+        results = searchNews(query, { limit })
       } else {
-        results = await getNews({ limit })
+        results = getNews({ limit })
       }
 
       return {
@@ -289,6 +289,17 @@ export function createTriggerTwitterScrapeTool(sessionId: string) {
       queries: z.array(z.string()).min(1).max(5).describe('要搜索的关键词数组，如 ["Solana", "SOL"]'),
     }),
     execute: async ({ queries }) => {
+      // 相同关键词的任务仍在进行时直接复用，避免重复抓取
+      const activeTask = findActiveScrapeTask(sessionId, queries)
+      if (activeTask) {
+        return {
+          success: true,
+          taskId: activeTask.id,
+          queries: activeTask.queries,
+          message: `相同关键词的抓取任务（${activeTask.queries.join(', ')}）已在进行中，完成后会自动通知用户，无需重复触发。`,
+        }
+      }
+
       const taskId = `scrape_${Date.now()}_${Math.random().toString(36).slice(2, 8)}`
       registerScrapeTask(taskId, sessionId, queries)
       executeScrapeTask(taskId).catch(err =>
@@ -317,14 +328,26 @@ export const tools = {
   getMarketPrice: getMarketPriceTool,
 }
 
+// 按 session 缓存工具集，避免每轮对话重新构建 tool 定义对象
+const sessionToolsCache = new Map<string, ReturnType<typeof buildSessionTools>>()
+
+function buildSessionTools(sessionId: string) {
+  return {
+    ...tools,
+    triggerTwitterScrape: createTriggerTwitterScrapeTool(sessionId),
+  }
+}
+
 /**
  * Create tools with session context (for session-aware tools like triggerTwitterScrape)
  */
 export function createSessionTools(sessionId: string) {
-  return {
-    ...tools,
-    triggerTwitterScrape: createTriggerTwitterScrapeTool(sessionId),
+  let sessionTools = sessionToolsCache.get(sessionId)
+  if (!sessionTools) {
+    sessionTools = buildSessionTools(sessionId)
+    sessionToolsCache.set(sessionId, sessionTools)
   }
+  return sessionTools
 }
 
 export type ToolName = keyof typeof tools | 'triggerTwitterScrape'
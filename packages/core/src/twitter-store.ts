@@ -6,7 +6,7 @@
 import { Database } from 'bun:sqlite'
 import { join } from 'path'
 import type { Tweet, TweetSortOptions } from './twitter'
-import { DEFAULT_SORT_OPTIONS, calculateWeightedScore } from './twitter'
+import { DEFAULT_SORT_OPTIONS, sortByWeightedScore } from './twitter'
 
 /**
  * Tweet record in database
@@ -196,16 +196,8 @@ export function searchTweetsInDB(
     )
     .all(query, limit * 2) // Fetch more for sorting
 
-  const tweets = rows.map(rowToTweet)
-
   // Apply weighted sorting
-  return tweets
-    .map(tweet => ({
-      ...tweet,
-      weightedScore: calculateWeightedScore(tweet, sortOptions),
-    }))
-    .sort((a, b) => (b.weightedScore || 0) - (a.weightedScore || 0))
-    .slice(0, limit)
+  return sortByWeightedScore(rows.map(rowToTweet), sortOptions).slice(0, limit)
 }
 
 /**
@@ -234,16 +226,8 @@ export function getTweetsByQuery(
     )
     .all(searchQuery, limit * 2)
 
-  const tweets = rows.map(rowToTweet)
-
   // Apply weighted sorting
-  return tweets
-    .map(tweet => ({
-      ...tweet,
-      weightedScore: calculateWeightedScore(tweet, sortOptions),
-    }))
-    .sort((a, b) => (b.weightedScore || 0) - (a.weightedScore || 0))
-    .slice(0, limit)
+  return sortByWeightedScore(rows.map(rowToTweet), sortOptions).slice(0, limit)
 }
 
 /**
@@ -276,16 +260,8 @@ export function getLatestTweets(
 
   const rows = database.query<TweetDBRow, (string | number)[]>(sql).all(...params)
 
-  const tweets = rows.map(rowToTweet)
-
   // Apply weighted sorting
-  return tweets
-    .map(tweet => ({
-      ...tweet,
-      weightedScore: calculateWeightedScore(tweet, sortOptions),
-    }))
-    .sort((a, b) => (b.weightedScore || 0) - (a.weightedScore || 0))
-    .slice(0, limit)
+  return sortByWeightedScore(rows.map(rowToTweet), sortOptions).slice(0, limit)
 }
 
 /**
@@ -318,16 +294,8 @@ export function getTopTweetsFromDB(
 
   const rows = database.query<TweetDBRow, (string | number)[]>(sql).all(...params)
 
-  const tweets = rows.map(rowToTweet)
-
   // Apply weighted sorting
-  return tweets
-    .map(tweet => ({
-      ...tweet,
-      weightedScore: calculateWeightedScore(tweet, sortOptions),
-    }))
-    .sort((a, b) => (b.weightedScore || 0) - (a.weightedScore || 0))
-    .slice(0, limit)
+  return sortByWeightedScore(rows.map(rowToTweet), sortOptions).slice(0, limit)
 }
 
 /**
@@ -4,6 +4,8 @@
  */
 
 import { Hono } from 'hono'
+import type { Context } from 'hono'
+import { getConnInfo } from 'hono/bun'
 import { cors } from 'hono/cors'
 import { logger } from 'hono/logger'
 import { streamSSE } from 'hono/streaming'
@@ -66,12 +68,8 @@ import {
 // Initialize
 loadConfig()
 
-// Async initialization for RAG and RSS
-async function initialize() {
-  // Initialize LLM providers
-  initProviders()
-
-  // Initialize News SQLite database
+// Initialize News SQLite database
+async function initializeNews() {
   try {
     initNewsDB()
     console.log('[Server] News database initialized')
@@ -85,8 +83,10 @@ async function initialize() {
   } catch (error) {
     console.error('[Server] News initialization failed:', error)
   }
+}
 
-  // Initialize Stock SQLite database
+// Initialize Stock SQLite database
+async function initializeStocks() {
   try {
     initStockDB()
     console.log('[Server] Stock database initialized')
@@ -100,8 +100,10 @@ async function initialize() {
   } catch (error) {
     console.error('[Server] Stock initialization failed:', error)
   }
+}
 
-  // Initialize Twitter SQLite database
+// Initialize Twitter SQLite database
+async function initializeTwitter() {
   try {
     initTwitterDB()
     const twitterStats = getTwitterStats()
@@ -112,8 +114,10 @@ async function initialize() {
   } catch (error) {
     console.error('[Server] Twitter initialization failed:', error)
   }
+}
 
-  // Initialize RAG
+// Initialize RAG
+async function initializeRAG() {
   try {
     await initRAG()
 
@@ -128,6 +132,16 @@ async function initialize() {
   }
 }
 
+// Async initialization for RAG and RSS
+async function initialize() {
+  // Initialize LLM providers
+  initProviders()
+
+  // 各子系统初始化互相独立且以网络 I/O 为主，并行执行缩短启动时间
+  // 每个子系统内部自行捕获错误，单个失败不影响其他子系统
+  await Promise.all([initializeNews(), initializeStocks(), initializeTwitter(), initializeRAG()])
+}
+
 // Execute initialization
 initialize()
 
@@ -136,7 +150,105 @@ const app = new Hono()
 
 // Middleware
 app.use('*', cors())
-app.use('*', logger())
+
+// 健康检查由 Docker/监控高频轮询，跳过请求日志避免刷屏
+const requestLogger = logger()
+app.use('*', (c, next) => {
+  if (c.req.path === API_ENDPOINTS.HEALTH) {
+    return next()
+  }
+  return requestLogger(c, next)
+})
+
+// ==================== Rate Limiting ====================
+
+// 令牌桶限流：每个客户端 IP 只保存 { tokens, lastRefillAt } 两个数字
+// 按 RATE_LIMIT_RPM 匀速补充令牌，设为 0 可关闭限流
+const RATE_LIMIT_RPM = parseInt(process.env.RATE_LIMIT_RPM || '120', 10)
+// 跟踪的 IP 数量上限，防止被枚举 IP 的探测流量撑爆内存
+const RATE_LIMIT_MAX_IPS = 10_000
+
+interface TokenBucket {
+  tokens: number
+  lastRefillAt: number
+}
+
+const rateLimitBuckets = new Map<string, TokenBucket>()
+
+function takeToken(ip: string): boolean {
+  const now = Date.now()
+  let bucket = rateLimitBuckets.get(ip)
+
+  if (!bucket) {
+    bucket = { tokens: RATE_LIMIT_RPM, lastRefillAt: now }
+  } else {
+    // 按流逝时间匀速补充，桶容量即每分钟配额
+    const refill = ((now - bucket.lastRefillAt) / 60_000) * RATE_LIMIT_RPM
+    bucket.tokens = Math.min(RATE_LIMIT_RPM, bucket.tokens + refill)
+    bucket.lastRefillAt = now
+    // 删除后重插，保持 Map 的插入顺序即访问新旧顺序（LRU）
+    rateLimitBuckets.delete(ip)
+  }
+  rateLimitBuckets.set(ip, bucket)
+
+  // 超限时从最久未访问端淘汰，但只淘汰已基本回满的桶：
+  // 回满意味着该客户端至少闲置了约一分钟，淘汰后重建拿到的额度和原桶一样，
+  // 不会把仍在消耗中（尤其是已被限住）的配额重置回满
+  if (rateLimitBuckets.size > RATE_LIMIT_MAX_IPS) {
+    let scanned = 0
+    for (const [idleIp, idleBucket] of rateLimitBuckets) {
+      const refilled = Math.min(
+        RATE_LIMIT_RPM,
+        idleBucket.tokens + ((now - idleBucket.lastRefillAt) / 60_000) * RATE_LIMIT_RPM
+      )
+      if (refilled >= RATE_LIMIT_RPM - 1) {
+        rateLimitBuckets.delete(idleIp)
+        break
+      }
+      // 未回满的桶都在最近一分钟内活跃过，会自然老化成可淘汰项，
+      // 只多看几个就收手，避免每次请求 O(N) 扫描
+      if (++scanned >= 8) break
+    }
+  }
+
+  if (bucket.tokens < 1) {
+    return false
+  }
+  bucket.tokens -= 1
+  return true
+}
+
+/**
+ * 解析客户端 IP（限流 key），只信任代理层写入的字段
+ * X-Real-IP 由 nginx 从 $remote_addr 设置，客户端无法伪造；
+ * X-Forwarded-For 用 $proxy_add_x_forwarded_for 追加，只有最后一段来自直连对端，
+ * 取第一段会让客户端随意换 header 刷新配额
+ */
+function getClientIp(c: Context): string {
+  const realIp = c.req.header('x-real-ip')
+  if (realIp) {
+    return realIp.trim()
+  }
+
+  const forwardedFor = c.req.header('x-forwarded-for')
+  if (forwardedFor) {
+    const entries = forwardedFor.split(',')
+    return entries[entries.length - 1].trim()
+  }
+
+  // 未经代理的直连：回退到 socket 对端地址
+  return getConnInfo(c).remote.address || 'unknown'
+}
+
+if (RATE_LIMIT_RPM > 0) {
+  app.use('/api/v1/*', async (c, next) => {
+    if (!takeToken(getClientIp(c))) {
+      return c.json({ success: false, error: 'Too many requests, please retry later' }, 429)
+    }
+
+    await next()
+  })
+}
 
 // Root route
 app.get('/', (c) => {
@@ -312,12 +424,12 @@ app.get(`${API_ENDPOINTS.MARKET_KLINES}/:symbol`, async (c) => {
 // ==================== News ====================
 
 // Get news
-app.get('/api/v1/news', async (c) => {
+app.get('/api/v1/news', (c) => {
   const limit = parseInt(c.req.query('limit') || '20', 10)
   const category = c.req.query('category')
 
   try {
-    const news = await getNews({ limit, category })
+    const news = getNews({ limit, category })
     return c.json({ success: true, data: news })
   } catch (error) {
     return c.json({ success: false, error: String(error) }, 500)
@@ -325,7 +437,7 @@ app.get('/api/v1/news', async (c) => {
 })
 
 // Search news
-app.get('/api/v1/news/search', async (c) => {
+app.get('/api/v1/news/search', (c) => {
   const query = c.req.query('q')
   const limit = parseInt(c.req.query('limit') || '20', 10)
 
@@ -334,7 +446,7 @@ app.get('/api/v1/news/search', async (c) => {
   }
 
   try {
-    const news = await searchNews(query, { limit })
+    const news = searchNews(query, { limit })
     return c.json({ success: true, data: news })
   } catch (error) {
     return c.json({ success: false, error: String(error) }, 500)